@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Callable
@@ -131,6 +132,12 @@ class BaseAuthorizer:
 
     AUTHENTICATOR_CLASS: tuple | type = BaseAuthenticator
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, excluding the refresh lock."""
+        state = self.__dict__.copy()
+        del state["_refresh_lock"]
+        return state
+
     def __init__(self, authenticator: BaseAuthenticator):
         """Represent a single authorization to Reddit's API.
 
@@ -138,9 +145,15 @@ class BaseAuthorizer:
 
         """
         self._authenticator = authenticator
+        self._refresh_lock = threading.Lock()
         self._clear_access_token()
         self._validate_authenticator()
 
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore the pickled state with a new refresh lock."""
+        self.__dict__.update(state)
+        self._refresh_lock = threading.Lock()
+
     def _clear_access_token(self):
         self._expiration_timestamp: float
         self.access_token: str | None = None
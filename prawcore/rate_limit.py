@@ -53,7 +53,7 @@ class RateLimiter:
         """Sleep for an amount of time to remain under the rate limit."""
         if self.next_request_timestamp is None:
             return
-        sleep_seconds = self.next_request_timestamp - time.time()
+        sleep_seconds = self.next_request_timestamp - time.monotonic()
         if sleep_seconds <= 0:
             return
         message = f"Sleeping: {sleep_seconds:0.2f} seconds prior to call"
@@ -70,25 +70,29 @@ class RateLimiter:
         should trigger exceptions that indicate invalid behavior.
 
         """
-        if "x-ratelimit-remaining" not in response_headers:
+        try:
+            remaining = float(response_headers["x-ratelimit-remaining"])
+        except KeyError:
             if self.remaining is not None:
                 self.remaining -= 1
                 self.used += 1
             return
 
-        now = time.time()
+        # Schedule requests on the monotonic clock so wall clock adjustments can't
+        # skew the delay; ``reset_timestamp`` remains a Unix timestamp
+        now = time.monotonic()
 
         seconds_to_reset = int(response_headers["x-ratelimit-reset"])
-        self.remaining = float(response_headers["x-ratelimit-remaining"])
+        self.remaining = remaining
         self.used = int(response_headers["x-ratelimit-used"])
-        self.reset_timestamp = now + seconds_to_reset
+        self.reset_timestamp = time.time() + seconds_to_reset
 
         if self.remaining <= 0:
-            self.next_request_timestamp = self.reset_timestamp
+            self.next_request_timestamp = now + seconds_to_reset
             return
 
         self.next_request_timestamp = min(
-            self.reset_timestamp,
+            now + seconds_to_reset,
             now
             + min(
                 max(
@@ -109,6 +109,8 @@ class Session:
         params: dict[str, int],
         url: str,
     ):
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         log.debug("Fetching: %s %s at %s", method, url, time.time())
         log.debug("Data: %s", pformat(data))
         log.debug("Params: %s", pformat(params))
@@ -278,7 +280,10 @@ class Session:
 
     def _set_header_callback(self) -> dict[str, str]:
         if not self._authorizer.is_valid() and hasattr(self._authorizer, "refresh"):
-            self._authorizer.refresh()
+            # Coalesce concurrent refreshes so only one token request is issued
+            with self._authorizer._refresh_lock:
+                if not self._authorizer.is_valid():
+                    self._authorizer.refresh()
         return {"Authorization": f"bearer {self._authorizer.access_token}"}
 
     def close(self):
@@ -10,6 +10,11 @@ import pytest
 
 from prawcore import Requestor, TrustedAuthenticator, UntrustedAuthenticator
 
+from .integration import unused_cassettes_message, used_cassettes
+
+crashed_xdist_workers = []
+xdist_workers_with_cassettes = []
+
 
 @pytest.fixture(autouse=True)
 def patch_sleep(monkeypatch):
@@ -22,7 +27,7 @@ def patch_sleep(monkeypatch):
     monkeypatch.setattr(time, "sleep", value=_sleep)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def image_path():
     """Return path to image."""
 
@@ -33,10 +38,26 @@ def image_path():
     return _get_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def too_large_jpg_bytes(image_path):
+    """Return the contents of ``too_large.jpg``."""
+    with open(image_path("too_large.jpg"), "rb") as fp:
+        return fp.read()
+
+
+@pytest.fixture(scope="session")
+def white_square_png_bytes(image_path):
+    """Return the contents of ``white-square.png``."""
+    with open(image_path("white-square.png"), "rb") as fp:
+        return fp.read()
+
+
+@pytest.fixture(scope="session")
 def requestor():
-    """Return path to image."""
-    return Requestor("prawcore:test (by /u/bboe)")
+    """Return a Requestor instance shared by all tests in the session."""
+    requestor = Requestor("prawcore:test (by /u/bboe)")
+    yield requestor
+    requestor.close()
 
 
 @pytest.fixture
@@ -76,6 +97,30 @@ def pytest_configure(config):
     )
 
 
+def pytest_sessionfinish(session):
+    # Only check when integration tests ran, and a crashed worker never reports
+    # its cassettes, so the check would misfire
+    if not xdist_workers_with_cassettes or crashed_xdist_workers:
+        return
+    message = unused_cassettes_message()
+    if message:
+        reporter = session.config.pluginmanager.get_plugin("terminalreporter")
+        # since the xdist progress line has not been terminated yet
+        reporter.write("\n")
+        reporter.write_line(message, red=True)
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    if error is not None or not hasattr(node, "workeroutput"):
+        crashed_xdist_workers.append(node)
+        return
+    if "used_cassettes" in node.workeroutput:
+        xdist_workers_with_cassettes.append(node)
+        used_cassettes.update(node.workeroutput["used_cassettes"])
+
+
 def two_factor_callback():
     """Return an OTP code."""
     return None
@@ -1,38 +1,44 @@
 """prawcore Integration test suite."""
 
 import os
-from urllib.parse import quote_plus
 
-import betamax
 import pytest
 from betamax.cassette import Cassette
 
-from ..utils import (
-    PrettyJSONSerializer,
-    ensure_integration_test,
-    filter_access_token,
-)
+from ..utils import ensure_integration_test
 
 CASSETTES_PATH = "tests/integration/cassettes"
-existing_cassettes = set()
 used_cassettes = set()
 
 
+def unused_cassettes_message():
+    """Return a failure message when enforced and some cassettes were not used."""
+    if os.getenv("ENSURE_NO_UNUSED_CASSETTES", "0") != "1":
+        return None
+    existing_cassettes = {
+        cassette[: cassette.rindex(".")] for cassette in os.listdir(CASSETTES_PATH)
+    }
+    unused_cassettes = existing_cassettes - used_cassettes
+    if not unused_cassettes:
+        return None
+    return f"The following cassettes are unused: {', '.join(unused_cassettes)}."
+
+
 class IntegrationTest:
     """Base class for prawcore integration tests."""
 
     @pytest.fixture(autouse=True, scope="session")
-    def cassette_tracker(self):
+    def cassette_tracker(self, request):
         """Track cassettes to ensure unused cassettes are not uploaded."""
-        global existing_cassettes
-        for cassette in os.listdir(CASSETTES_PATH):
-            existing_cassettes.add(cassette[: cassette.rindex(".")])
         yield
-        unused_cassettes = existing_cassettes - used_cassettes
-        if unused_cassettes and os.getenv("ENSURE_NO_UNUSED_CASSETTES", "0") == "1":
-            raise AssertionError(
-                f"The following cassettes are unused: {', '.join(unused_cassettes)}."
-            )
+        worker_output = getattr(request.config, "workeroutput", None)
+        if worker_output is not None:
+            # The pytest-xdist controller checks the cassettes used by all workers
+            worker_output["used_cassettes"] = sorted(used_cassettes)
+            return
+        message = unused_cassettes_message()
+        if message:
+            raise AssertionError(message)
 
     @pytest.fixture(autouse=True)
     def cassette(self, request, recorder, cassette_name):
@@ -56,21 +62,15 @@ class IntegrationTest:
             used_cassettes.add(cassette_name)
 
     @pytest.fixture(autouse=True)
-    def recorder(self, requestor):
-        """Configure Betamax."""
-        recorder = betamax.Betamax(requestor)
-        recorder.register_serializer(PrettyJSONSerializer)
-        with betamax.Betamax.configure() as config:
-            config.cassette_library_dir = CASSETTES_PATH
-            config.default_cassette_options["serialize_with"] = "prettyjson"
-            config.before_record(callback=filter_access_token)
-            for key, value in pytest.placeholders.__dict__.items():
-                if key == "password":
-                    value = quote_plus(value)
-                config.define_cassette_placeholder(f"<{key.upper()}>", value)
-            yield recorder
-            # since placeholders persist between tests
-            Cassette.default_cassette_options["placeholders"] = []
+    def recorder(self, default_placeholders, requestor, shared_recorder):
+        """Return the shared Betamax recorder."""
+        yield shared_recorder
+        # since cookies set by one cassette would be sent in every later test
+        requestor._http.cookies.clear()
+        # since placeholders added by markers persist between tests
+        Cassette.default_cassette_options["placeholders"] = list(default_placeholders)
+        # since the adapter accumulates the options passed to use_cassette
+        shared_recorder.betamax_adapter.options.clear()
 
     @pytest.fixture
     def cassette_name(self, request):
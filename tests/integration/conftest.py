@@ -0,0 +1,30 @@
+"""Prepare the integration tests."""
+
+from urllib.parse import quote_plus
+
+import betamax
+import pytest
+
+from ..utils import PrettyJSONSerializer, filter_access_token
+from . import CASSETTES_PATH
+
+
+@pytest.fixture(scope="session")
+def default_placeholders():
+    """Configure Betamax once and return the default cassette placeholders."""
+    betamax.Betamax.register_serializer(PrettyJSONSerializer)
+    with betamax.Betamax.configure() as config:
+        config.cassette_library_dir = CASSETTES_PATH
+        config.default_cassette_options["serialize_with"] = "prettyjson"
+        config.before_record(callback=filter_access_token)
+        for key, value in pytest.placeholders.__dict__.items():
+            if key == "password":
+                value = quote_plus(value)
+            config.define_cassette_placeholder(f"<{key.upper()}>", value)
+        return list(config.default_cassette_options["placeholders"])
+
+
+@pytest.fixture(scope="session")
+def shared_recorder(default_placeholders, requestor):
+    """Return a Betamax recorder shared by all integration tests."""
+    return betamax.Betamax(requestor)
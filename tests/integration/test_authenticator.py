@@ -8,29 +8,42 @@ from . import IntegrationTest
 
 
 class TestTrustedAuthenticator(IntegrationTest):
-    def test_revoke_token(self, requestor):
-        authenticator = prawcore.TrustedAuthenticator(
+    @pytest.fixture(scope="class")
+    def trusted_revoke_authenticator(self, requestor):
+        return prawcore.TrustedAuthenticator(
             requestor,
             pytest.placeholders.client_id,
             pytest.placeholders.client_secret,
         )
-        authenticator.revoke_token("dummy token")
 
-    def test_revoke_token__with_access_token_hint(self, requestor):
-        authenticator = prawcore.TrustedAuthenticator(
-            requestor,
-            pytest.placeholders.client_id,
-            pytest.placeholders.client_secret,
-        )
-        authenticator.revoke_token("dummy token", "access_token")
-
-    def test_revoke_token__with_refresh_token_hint(self, requestor):
-        authenticator = prawcore.TrustedAuthenticator(
-            requestor,
-            pytest.placeholders.client_id,
-            pytest.placeholders.client_secret,
-        )
-        authenticator.revoke_token("dummy token", "refresh_token")
+    @pytest.mark.parametrize(
+        "token_type",
+        [
+            pytest.param(
+                None,
+                id="without_hint",
+                marks=pytest.mark.cassette_name(
+                    "TestTrustedAuthenticator.test_revoke_token"
+                ),
+            ),
+            pytest.param(
+                "access_token",
+                id="with_access_token_hint",
+                marks=pytest.mark.cassette_name(
+                    "TestTrustedAuthenticator.test_revoke_token__with_access_token_hint"
+                ),
+            ),
+            pytest.param(
+                "refresh_token",
+                id="with_refresh_token_hint",
+                marks=pytest.mark.cassette_name(
+                    "TestTrustedAuthenticator.test_revoke_token__with_refresh_token_hint"
+                ),
+            ),
+        ],
+    )
+    def test_revoke_token(self, token_type, trusted_revoke_authenticator):
+        trusted_revoke_authenticator.revoke_token("dummy token", token_type)
 
 
 class TestUntrustedAuthenticator(IntegrationTest):
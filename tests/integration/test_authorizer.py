@@ -6,140 +6,143 @@ import prawcore
 
 from . import IntegrationTest
 
+CLIENT_ID = pytest.placeholders.client_id
+CLIENT_SECRET = pytest.placeholders.client_secret
+PASSWORD = pytest.placeholders.password
+PERMANENT_GRANT_CODE = pytest.placeholders.permanent_grant_code
+REDIRECT_URI = pytest.placeholders.redirect_uri
+REFRESH_TOKEN = pytest.placeholders.refresh_token
+SCOPES = frozenset({"adsedit", "adsread", "creddits", "history"})
+SHORT_DEVICE_ID = "a" * 19
+TEMPORARY_GRANT_CODE = pytest.placeholders.temporary_grant_code
+USERNAME = pytest.placeholders.username
+
+
+def assert_not_refreshed(authorizer):
+    assert authorizer.access_token is None
+    assert authorizer.scopes is None
+    assert not authorizer.is_valid()
+
+
+def assert_refreshed(authorizer, scopes=frozenset({"*"})):
+    assert authorizer.access_token is not None
+    assert authorizer.scopes == scopes
+    assert authorizer.is_valid()
+
+
+def post_refresh_callback(authorizer):
+    assert authorizer.refresh_token != REFRESH_TOKEN
+    authorizer.refresh_token = "manually_updated"
+
+
+def pre_refresh_callback(authorizer):
+    assert authorizer.refresh_token is None
+    authorizer.refresh_token = REFRESH_TOKEN
+
 
 class TestAuthorizer(IntegrationTest):
+    @pytest.fixture
+    def refreshed_authorizer(self, trusted_authenticator):
+        authorizer = prawcore.Authorizer(
+            trusted_authenticator, refresh_token=REFRESH_TOKEN
+        )
+        authorizer.refresh()
+        return authorizer
+
     def test_authorize__with_invalid_code(self, trusted_authenticator):
-        trusted_authenticator.redirect_uri = pytest.placeholders.redirect_uri
+        trusted_authenticator.redirect_uri = REDIRECT_URI
         authorizer = prawcore.Authorizer(trusted_authenticator)
-        with pytest.raises(prawcore.OAuthException):
+        with pytest.raises(prawcore.OAuthException, match="invalid_grant error"):
             authorizer.authorize("invalid code")
         assert not authorizer.is_valid()
 
     def test_authorize__with_permanent_grant(self, trusted_authenticator):
-        trusted_authenticator.redirect_uri = pytest.placeholders.redirect_uri
+        trusted_authenticator.redirect_uri = REDIRECT_URI
         authorizer = prawcore.Authorizer(trusted_authenticator)
-        authorizer.authorize(pytest.placeholders.permanent_grant_code)
+        authorizer.authorize(PERMANENT_GRANT_CODE)
 
         assert authorizer.access_token is not None
         assert authorizer.refresh_token is not None
         assert isinstance(authorizer.scopes, set)
-        assert len(authorizer.scopes) > 0
+        assert authorizer.scopes
         assert authorizer.is_valid()
 
     def test_authorize__with_temporary_grant(self, trusted_authenticator):
-        trusted_authenticator.redirect_uri = pytest.placeholders.redirect_uri
+        trusted_authenticator.redirect_uri = REDIRECT_URI
         authorizer = prawcore.Authorizer(trusted_authenticator)
-        authorizer.authorize(pytest.placeholders.temporary_grant_code)
+        authorizer.authorize(TEMPORARY_GRANT_CODE)
 
         assert authorizer.access_token is not None
         assert authorizer.refresh_token is None
         assert isinstance(authorizer.scopes, set)
-        assert len(authorizer.scopes) > 0
-        assert authorizer.is_valid()
-
-    def test_refresh(self, trusted_authenticator):
-        authorizer = prawcore.Authorizer(
-            trusted_authenticator, refresh_token=pytest.placeholders.refresh_token
-        )
-        authorizer.refresh()
-
-        assert authorizer.access_token is not None
-        assert isinstance(authorizer.scopes, set)
-        assert len(authorizer.scopes) > 0
-        assert authorizer.is_valid()
-
-    @pytest.mark.cassette_name("TestAuthorizer.test_refresh")
-    def test_refresh__post_refresh_callback(self, trusted_authenticator):
-        def callback(authorizer):
-            assert authorizer.refresh_token != pytest.placeholders.refresh_token
-            authorizer.refresh_token = "manually_updated"
-
-        authorizer = prawcore.Authorizer(
-            trusted_authenticator,
-            post_refresh_callback=callback,
-            refresh_token=pytest.placeholders.refresh_token,
-        )
-        authorizer.refresh()
-
-        assert authorizer.access_token is not None
-        assert authorizer.refresh_token == "manually_updated"
-        assert isinstance(authorizer.scopes, set)
-        assert len(authorizer.scopes) > 0
+        assert authorizer.scopes
         assert authorizer.is_valid()
 
     @pytest.mark.cassette_name("TestAuthorizer.test_refresh")
-    def test_refresh__pre_refresh_callback(self, trusted_authenticator):
-        def callback(authorizer):
-            assert authorizer.refresh_token is None
-            authorizer.refresh_token = pytest.placeholders.refresh_token
-
-        authorizer = prawcore.Authorizer(
-            trusted_authenticator, pre_refresh_callback=callback
-        )
+    @pytest.mark.parametrize(
+        "authorizer_kwargs",
+        [
+            {"refresh_token": REFRESH_TOKEN},
+            {
+                "post_refresh_callback": post_refresh_callback,
+                "refresh_token": REFRESH_TOKEN,
+            },
+            {"pre_refresh_callback": pre_refresh_callback},
+        ],
+        ids=["without_callback", "post_refresh_callback", "pre_refresh_callback"],
+    )
+    def test_refresh(self, authorizer_kwargs, trusted_authenticator):
+        authorizer = prawcore.Authorizer(trusted_authenticator, **authorizer_kwargs)
         authorizer.refresh()
 
         assert authorizer.access_token is not None
+        if "post_refresh_callback" in authorizer_kwargs:
+            assert authorizer.refresh_token == "manually_updated"
         assert isinstance(authorizer.scopes, set)
-        assert len(authorizer.scopes) > 0
+        assert authorizer.scopes
         assert authorizer.is_valid()
 
     def test_refresh__with_invalid_token(self, trusted_authenticator):
         authorizer = prawcore.Authorizer(
             trusted_authenticator, refresh_token="INVALID_TOKEN"
         )
-        with pytest.raises(prawcore.ResponseException):
+        with pytest.raises(prawcore.ResponseException, match="received 400 HTTP"):
             authorizer.refresh()
         assert not authorizer.is_valid()
 
-    def test_revoke__access_token_with_refresh_set(self, trusted_authenticator):
-        authorizer = prawcore.Authorizer(
-            trusted_authenticator, refresh_token=pytest.placeholders.refresh_token
-        )
-        authorizer.refresh()
-        authorizer.revoke(only_access=True)
+    def test_revoke__access_token_with_refresh_set(self, refreshed_authorizer):
+        refreshed_authorizer.revoke(only_access=True)
 
-        assert authorizer.access_token is None
-        assert authorizer.refresh_token is not None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
+        assert_not_refreshed(refreshed_authorizer)
+        assert refreshed_authorizer.refresh_token is not None
 
-        authorizer.refresh()
+        refreshed_authorizer.refresh()
 
-        assert authorizer.is_valid()
+        assert refreshed_authorizer.is_valid()
 
     def test_revoke__access_token_without_refresh_set(self, trusted_authenticator):
-        trusted_authenticator.redirect_uri = pytest.placeholders.redirect_uri
+        trusted_authenticator.redirect_uri = REDIRECT_URI
         authorizer = prawcore.Authorizer(trusted_authenticator)
-        authorizer.authorize(pytest.placeholders.temporary_grant_code)
+        authorizer.authorize(TEMPORARY_GRANT_CODE)
         authorizer.revoke()
 
-        assert authorizer.access_token is None
+        assert_not_refreshed(authorizer)
         assert authorizer.refresh_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
 
-    def test_revoke__refresh_token_with_access_set(self, trusted_authenticator):
-        authorizer = prawcore.Authorizer(
-            trusted_authenticator, refresh_token=pytest.placeholders.refresh_token
-        )
-        authorizer.refresh()
-        authorizer.revoke()
+    def test_revoke__refresh_token_with_access_set(self, refreshed_authorizer):
+        refreshed_authorizer.revoke()
 
-        assert authorizer.access_token is None
-        assert authorizer.refresh_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
+        assert_not_refreshed(refreshed_authorizer)
+        assert refreshed_authorizer.refresh_token is None
 
     def test_revoke__refresh_token_without_access_set(self, trusted_authenticator):
         authorizer = prawcore.Authorizer(
-            trusted_authenticator, refresh_token=pytest.placeholders.refresh_token
+            trusted_authenticator, refresh_token=REFRESH_TOKEN
         )
         authorizer.revoke()
 
-        assert authorizer.access_token is None
+        assert_not_refreshed(authorizer)
         assert authorizer.refresh_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
 
 
 class TestDeviceIDAuthorizer(IntegrationTest):
@@ -147,122 +150,97 @@ class TestDeviceIDAuthorizer(IntegrationTest):
         authorizer = prawcore.DeviceIDAuthorizer(untrusted_authenticator)
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == {"*"}
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer)
 
     def test_refresh__with_scopes_and_trusted_authenticator(
         self, requestor, untrusted_authenticator
     ):
-        scope_list = {"adsedit", "adsread", "creddits", "history"}
         authorizer = prawcore.DeviceIDAuthorizer(
             prawcore.TrustedAuthenticator(
                 requestor,
-                pytest.placeholders.client_id,
-                pytest.placeholders.client_secret,
+                CLIENT_ID,
+                CLIENT_SECRET,
             ),
-            scopes=scope_list,
+            scopes=SCOPES,
         )
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == scope_list
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer, SCOPES)
 
     def test_refresh__with_short_device_id(self, untrusted_authenticator):
-        authorizer = prawcore.DeviceIDAuthorizer(untrusted_authenticator, "a" * 19)
-        with pytest.raises(prawcore.OAuthException):
+        authorizer = prawcore.DeviceIDAuthorizer(
+            untrusted_authenticator, SHORT_DEVICE_ID
+        )
+        with pytest.raises(prawcore.OAuthException, match="bad device_id"):
             authorizer.refresh()
 
 
 class TestReadOnlyAuthorizer(IntegrationTest):
     def test_refresh(self, trusted_authenticator):
         authorizer = prawcore.ReadOnlyAuthorizer(trusted_authenticator)
-        assert authorizer.access_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
+        assert_not_refreshed(authorizer)
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == {"*"}
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer)
 
     def test_refresh__with_scopes(self, trusted_authenticator):
-        scope_list = {"adsedit", "adsread", "creddits", "history"}
-        authorizer = prawcore.ReadOnlyAuthorizer(
-            trusted_authenticator, scopes=scope_list
-        )
-        assert authorizer.access_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
+        authorizer = prawcore.ReadOnlyAuthorizer(trusted_authenticator, scopes=SCOPES)
+        assert_not_refreshed(authorizer)
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == scope_list
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer, SCOPES)
 
 
 class TestScriptAuthorizer(IntegrationTest):
     def test_refresh(self, trusted_authenticator):
         authorizer = prawcore.ScriptAuthorizer(
             trusted_authenticator,
-            pytest.placeholders.username,
-            pytest.placeholders.password,
+            USERNAME,
+            PASSWORD,
         )
-        assert authorizer.access_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
+        assert_not_refreshed(authorizer)
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == {"*"}
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer)
 
     def test_refresh__with_invalid_otp(self, trusted_authenticator):
         authorizer = prawcore.ScriptAuthorizer(
             trusted_authenticator,
-            pytest.placeholders.username,
-            pytest.placeholders.password,
+            USERNAME,
+            PASSWORD,
             lambda: "fake",
         )
-        with pytest.raises(prawcore.OAuthException):
+        with pytest.raises(prawcore.OAuthException, match="invalid_grant error"):
             authorizer.refresh()
         assert not authorizer.is_valid()
 
     def test_refresh__with_invalid_username_or_password(self, trusted_authenticator):
         authorizer = prawcore.ScriptAuthorizer(
-            trusted_authenticator, pytest.placeholders.username, "invalidpassword"
+            trusted_authenticator, USERNAME, "invalidpassword"
         )
-        with pytest.raises(prawcore.OAuthException):
+        with pytest.raises(prawcore.OAuthException, match="unauthorized_client"):
             authorizer.refresh()
         assert not authorizer.is_valid()
 
     def test_refresh__with_scopes(self, trusted_authenticator):
-        scope_list = {"adsedit", "adsread", "creddits", "history"}
         authorizer = prawcore.ScriptAuthorizer(
             trusted_authenticator,
-            pytest.placeholders.username,
-            pytest.placeholders.password,
-            scopes=scope_list,
+            USERNAME,
+            PASSWORD,
+            scopes=SCOPES,
         )
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == scope_list
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer, SCOPES)
 
     def test_refresh__with_valid_otp(self, trusted_authenticator):
         authorizer = prawcore.ScriptAuthorizer(
             trusted_authenticator,
-            pytest.placeholders.username,
-            pytest.placeholders.password,
+            USERNAME,
+            PASSWORD,
             lambda: "000000",
         )
-        assert authorizer.access_token is None
-        assert authorizer.scopes is None
-        assert not authorizer.is_valid()
+        assert_not_refreshed(authorizer)
         authorizer.refresh()
 
-        assert authorizer.access_token is not None
-        assert authorizer.scopes == {"*"}
-        assert authorizer.is_valid()
+        assert_refreshed(authorizer)
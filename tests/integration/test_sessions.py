@@ -1,8 +1,9 @@
 """Test for prawcore.Sessions module."""
 
 import logging
-from json import dumps
+import os
 
+import orjson
 import pytest
 
 import prawcore
@@ -10,7 +11,24 @@ import prawcore
 from . import IntegrationTest
 
 
+class MessageHandler(logging.Handler):
+    def __init__(self, message):
+        super().__init__(logging.DEBUG)
+        self.found = False
+        self.message = message
+
+    def emit(self, record):
+        if not self.found and self.message in record.getMessage():
+            self.found = True
+
+
 class TestSession(IntegrationTest):
+    @pytest.fixture
+    def generic_user_agent(self, monkeypatch, requestor):
+        monkeypatch.setitem(
+            requestor._http.headers, "User-Agent", "python-requests/2.25.1"
+        )
+
     @pytest.fixture
     def readonly_authorizer(self, trusted_authenticator):
         authorizer = prawcore.ReadOnlyAuthorizer(trusted_authenticator)
@@ -27,25 +45,25 @@ class TestSession(IntegrationTest):
         authorizer.refresh()
         return authorizer
 
+    @pytest.fixture(scope="class")
+    def uri_too_long_path(self):
+        path_start = "/api/morechildren?link_id=t3_n7r3uz&children="
+        with open(
+            os.path.join(os.path.dirname(__file__), "files", "comment_ids.txt")
+        ) as fp:
+            return path_start + fp.read(9996 - len(path_start))
+
     def test_request__accepted(self, script_authorizer, caplog):
-        caplog.set_level(logging.DEBUG)
-        session = prawcore.Session(script_authorizer)
-        session.request("POST", "api/read_all_messages")
-        found_message = False
-        for package, level, message in caplog.record_tuples:
-            if (
-                package == "prawcore"
-                and level == logging.DEBUG
-                and "Response: 202 (2 bytes)" in message
-            ):
-                found_message = True
-        assert found_message, f"'Response: 202 (2 bytes)' in {caplog.record_tuples}"
-
-    def test_request__bad_gateway(self, readonly_authorizer):
-        session = prawcore.Session(readonly_authorizer)
-        with pytest.raises(prawcore.ServerError) as exception_info:
-            session.request("GET", "/")
-        assert exception_info.value.response.status_code == 502
+        caplog.set_level(logging.DEBUG, logger="prawcore")
+        handler = MessageHandler("Response: 202 (2 bytes)")
+        logger = logging.getLogger("prawcore")
+        logger.addHandler(handler)
+        try:
+            session = prawcore.Session(script_authorizer)
+            session.request("POST", "api/read_all_messages")
+        finally:
+            logger.removeHandler(handler)
+        assert handler.found, f"'Response: 202 (2 bytes)' in {caplog.record_tuples}"
 
     def test_request__bad_json(self, script_authorizer):
         session = prawcore.Session(script_authorizer)
@@ -59,54 +77,139 @@ class TestSession(IntegrationTest):
             session.request(
                 "PUT", "/api/v1/me/friends/spez", data='{"note": "prawcore"}'
             )
-        assert "reason" in exception_info.value.response.json()
+        assert "reason" in orjson.loads(exception_info.value.response.content)
 
-    def test_request__cloudflare_connection_timed_out(self, readonly_authorizer):
-        session = prawcore.Session(readonly_authorizer)
-        with pytest.raises(prawcore.ServerError) as exception_info:
-            session.request("GET", "/")
-            session.request("GET", "/")
-            session.request("GET", "/")
-        assert exception_info.value.response.status_code == 522
-
-    def test_request__cloudflare_unknown_error(self, readonly_authorizer):
-        session = prawcore.Session(readonly_authorizer)
-        with pytest.raises(prawcore.ServerError) as exception_info:
-            session.request("GET", "/")
-            session.request("GET", "/")
-            session.request("GET", "/")
-        assert exception_info.value.response.status_code == 520
-
-    def test_request__conflict(self, script_authorizer):
-        session = prawcore.Session(script_authorizer)
-        previous = "f0214574-430d-11e7-84ca-1201093304fa"
-        with pytest.raises(prawcore.Conflict) as exception_info:
-            session.request(
+    @pytest.mark.parametrize(
+        ("method", "path", "data", "exception_class", "status_code"),
+        [
+            pytest.param(
                 "POST",
                 "/r/ThirdRealm/api/wiki/edit",
-                data={
+                {
                     "content": "New text",
                     "page": "index",
-                    "previous": previous,
+                    "previous": "f0214574-430d-11e7-84ca-1201093304fa",
                 },
-            )
-        assert exception_info.value.response.status_code == 409
+                prawcore.Conflict,
+                409,
+                id="conflict",
+                marks=pytest.mark.cassette_name("TestSession.test_request__conflict"),
+            ),
+            pytest.param(
+                "GET",
+                "/user/spez/gilded/given",
+                None,
+                prawcore.Forbidden,
+                403,
+                id="forbidden",
+                marks=pytest.mark.cassette_name("TestSession.test_request__forbidden"),
+            ),
+            pytest.param(
+                "GET",
+                "/r/reddit_api_test/wiki/invalid",
+                None,
+                prawcore.NotFound,
+                404,
+                id="not_found",
+                marks=pytest.mark.cassette_name("TestSession.test_request__not_found"),
+            ),
+            pytest.param(
+                "POST",
+                "r/ttft/api/wiki/edit/",
+                {
+                    "content": "type: submission\naction: upvote",
+                    "page": "config/automoderator",
+                },
+                prawcore.SpecialError,
+                415,
+                id="unsupported_media_type",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__unsupported_media_type"
+                ),
+            ),
+        ],
+    )
+    def test_request__client_error(
+        self, data, exception_class, method, path, script_authorizer, status_code
+    ):
+        session = prawcore.Session(script_authorizer)
+        with pytest.raises(exception_class) as exception_info:
+            session.request(method, path, data=data)
+        assert exception_info.value.response.status_code == status_code
 
     def test_request__created(self, script_authorizer):
         session = prawcore.Session(script_authorizer)
         response = session.request("PUT", "/api/v1/me/friends/spez", data="{}")
         assert "name" in response
 
-    def test_request__forbidden(self, script_authorizer):
-        session = prawcore.Session(script_authorizer)
-        with pytest.raises(prawcore.Forbidden):
-            session.request("GET", "/user/spez/gilded/given")
-
-    def test_request__gateway_timeout(self, readonly_authorizer):
+    @pytest.mark.parametrize(
+        ("status_code", "exception_class"),
+        [
+            pytest.param(
+                451,
+                prawcore.UnavailableForLegalReasons,
+                id="unavailable_for_legal_reasons",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__unavailable_for_legal_reasons"
+                ),
+            ),
+            pytest.param(
+                500,
+                prawcore.ServerError,
+                id="internal_server_error",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__internal_server_error"
+                ),
+            ),
+            pytest.param(
+                502,
+                prawcore.ServerError,
+                id="bad_gateway",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__bad_gateway"
+                ),
+            ),
+            pytest.param(
+                503,
+                prawcore.ServerError,
+                id="service_unavailable",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__service_unavailable"
+                ),
+            ),
+            pytest.param(
+                504,
+                prawcore.ServerError,
+                id="gateway_timeout",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__gateway_timeout"
+                ),
+            ),
+            pytest.param(
+                520,
+                prawcore.ServerError,
+                id="cloudflare_unknown_error",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__cloudflare_unknown_error"
+                ),
+            ),
+            pytest.param(
+                522,
+                prawcore.ServerError,
+                id="cloudflare_connection_timed_out",
+                marks=pytest.mark.cassette_name(
+                    "TestSession.test_request__cloudflare_connection_timed_out"
+                ),
+            ),
+        ],
+    )
+    def test_request__error_status(
+        self, exception_class, readonly_authorizer, status_code
+    ):
         session = prawcore.Session(readonly_authorizer)
-        with pytest.raises(prawcore.ServerError) as exception_info:
+        with pytest.raises(exception_class) as exception_info:
             session.request("GET", "/")
-        assert exception_info.value.response.status_code == 504
+        assert exception_info.value.response.status_code == status_code
 
     def test_request__get(self, readonly_authorizer):
         session = prawcore.Session(readonly_authorizer)
@@ -116,25 +219,14 @@ class TestSession(IntegrationTest):
         assert len(params) == 1
         assert response["kind"] == "Listing"
 
-    def test_request__internal_server_error(self, readonly_authorizer):
-        session = prawcore.Session(readonly_authorizer)
-        with pytest.raises(prawcore.ServerError) as exception_info:
-            session.request("GET", "/")
-        assert exception_info.value.response.status_code == 500
-
     def test_request__no_content(self, script_authorizer):
         session = prawcore.Session(script_authorizer)
         response = session.request("DELETE", "/api/v1/me/friends/spez")
         assert response is None
 
-    def test_request__not_found(self, script_authorizer):
-        session = prawcore.Session(script_authorizer)
-        with pytest.raises(prawcore.NotFound):
-            session.request("GET", "/r/reddit_api_test/wiki/invalid")
-
     def test_request__okay_with_0_byte_content(self, script_authorizer):
         session = prawcore.Session(script_authorizer)
-        data = {"model": dumps({"name": "redditdev"})}
+        data = {"model": '{"name": "redditdev"}'}
         path = f"/api/multi/user/{pytest.placeholders.username}/m/praw_x5g968f66a/r/redditdev"
         response = session.request("DELETE", path, data=data)
         assert response == ""
@@ -160,18 +252,16 @@ class TestSession(IntegrationTest):
         assert "a_test_from_prawcore" in response["json"]["data"]["url"]
         assert key_count == len(data)  # Ensure data is untouched
 
-    @pytest.mark.recorder_kwargs(match_requests_on=["uri", "method"])
-    def test_request__post__with_files(self, script_authorizer):
+    def test_request__post__with_files(self, script_authorizer, white_square_png_bytes):
         session = prawcore.Session(script_authorizer)
         data = {"upload_type": "header"}
-        with open("tests/integration/files/white-square.png", "rb") as fp:
-            files = {"file": fp}
-            response = session.request(
-                "POST",
-                "/r/reddit_api_test/api/upload_sr_img",
-                data=data,
-                files=files,
-            )
+        files = {"file": ("white-square.png", white_square_png_bytes)}
+        response = session.request(
+            "POST",
+            "/r/reddit_api_test/api/upload_sr_img",
+            data=data,
+            files=files,
+        )
         assert "img_src" in response
 
     def test_request__raw_json(self, readonly_authorizer):
@@ -197,18 +287,12 @@ class TestSession(IntegrationTest):
             session.request("GET", "t/bird")
         assert exception_info.value.path == "/r/t:bird/"
 
-    def test_request__service_unavailable(self, readonly_authorizer):
-        session = prawcore.Session(readonly_authorizer)
-        with pytest.raises(prawcore.ServerError) as exception_info:
-            session.request("GET", "/")
-            session.request("GET", "/")
-            session.request("GET", "/")
-        assert exception_info.value.response.status_code == 503
-
-    def test_request__too__many_requests__with_retry_headers(self, readonly_authorizer):
+    def test_request__too__many_requests__with_retry_headers(
+        self, monkeypatch, readonly_authorizer
+    ):
         session = prawcore.Session(readonly_authorizer)
-        session._requestor._http.headers.update(
-            {"User-Agent": "python-requests/2.25.1"}
+        monkeypatch.setitem(
+            session._requestor._http.headers, "User-Agent", "python-requests/2.25.1"
         )
         with pytest.raises(prawcore.TooManyRequests) as exception_info:
             session.request("GET", "/api/v1/me")
@@ -220,65 +304,38 @@ class TestSession(IntegrationTest):
         )
         assert exception_info.value.message.startswith("\n<!doctype html>")
 
-    def test_request__too__many_requests__without_retry_headers(self, requestor):
-        requestor._http.headers.update({"User-Agent": "python-requests/2.25.1"})
-        authorizer = prawcore.ReadOnlyAuthorizer(
-            prawcore.TrustedAuthenticator(
-                requestor,
-                pytest.placeholders.client_id,
-                pytest.placeholders.client_secret,
-            )
-        )
+    @pytest.mark.usefixtures("generic_user_agent")
+    def test_request__too__many_requests__without_retry_headers(
+        self, trusted_authenticator
+    ):
+        authorizer = prawcore.ReadOnlyAuthorizer(trusted_authenticator)
         with pytest.raises(prawcore.exceptions.ResponseException) as exception_info:
             authorizer.refresh()
         assert exception_info.value.response.status_code == 429
         assert not exception_info.value.response.headers.get("retry-after")
         assert exception_info.value.response.reason == "Too Many Requests"
-        assert exception_info.value.response.json() == {
+        assert orjson.loads(exception_info.value.response.content) == {
             "message": "Too Many Requests",
             "error": 429,
         }
 
-    @pytest.mark.recorder_kwargs(match_requests_on=["uri", "method"])
-    def test_request__too_large(self, script_authorizer):
+    def test_request__too_large(self, script_authorizer, too_large_jpg_bytes):
         session = prawcore.Session(script_authorizer)
         data = {"upload_type": "header"}
-        with open("tests/integration/files/too_large.jpg", "rb") as fp:
-            files = {"file": fp}
-            with pytest.raises(prawcore.TooLarge) as exception_info:
-                session.request(
-                    "POST",
-                    "/r/reddit_api_test/api/upload_sr_img",
-                    data=data,
-                    files=files,
-                )
+        files = {"file": ("too_large.jpg", too_large_jpg_bytes)}
+        with pytest.raises(prawcore.TooLarge) as exception_info:
+            session.request(
+                "POST",
+                "/r/reddit_api_test/api/upload_sr_img",
+                data=data,
+                files=files,
+            )
         assert exception_info.value.response.status_code == 413
 
-    def test_request__unavailable_for_legal_reasons(self, readonly_authorizer):
+    def test_request__uri_too_long(self, readonly_authorizer, uri_too_long_path):
         session = prawcore.Session(readonly_authorizer)
-        exception_class = prawcore.UnavailableForLegalReasons
-        with pytest.raises(exception_class) as exception_info:
-            session.request("GET", "/")
-        assert exception_info.value.response.status_code == 451
-
-    def test_request__unsupported_media_type(self, script_authorizer):
-        session = prawcore.Session(script_authorizer)
-        exception_class = prawcore.SpecialError
-        data = {
-            "content": "type: submission\naction: upvote",
-            "page": "config/automoderator",
-        }
-        with pytest.raises(exception_class) as exception_info:
-            session.request("POST", "r/ttft/api/wiki/edit/", data=data)
-        assert exception_info.value.response.status_code == 415
-
-    def test_request__uri_too_long(self, readonly_authorizer):
-        session = prawcore.Session(readonly_authorizer)
-        path_start = "/api/morechildren?link_id=t3_n7r3uz&children="
-        with open("tests/integration/files/comment_ids.txt") as fp:
-            ids = fp.read()
         with pytest.raises(prawcore.URITooLong) as exception_info:
-            session.request("GET", (path_start + ids)[:9996])
+            session.request("GET", uri_too_long_path)
         assert exception_info.value.response.status_code == 414
 
     def test_request__with_insufficient_scope(self, trusted_authenticator):
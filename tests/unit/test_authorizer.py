@@ -1,5 +1,7 @@
 """Test for prawcore.auth.Authorizer classes."""
 
+import pickle
+
 import pytest
 
 import prawcore
@@ -43,6 +45,15 @@ class TestAuthorizer(UnitTest):
         assert authorizer.refresh_token is None
         assert not authorizer.is_valid()
 
+    def test_pickle(self, trusted_authenticator):
+        authorizer = prawcore.Authorizer(
+            trusted_authenticator, refresh_token=pytest.placeholders.refresh_token
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(authorizer, protocol=protocol))
+            assert other.refresh_token == authorizer.refresh_token
+            assert other._refresh_lock is not authorizer._refresh_lock
+
     def test_refresh__without_refresh_token(self, trusted_authenticator):
         authorizer = prawcore.Authorizer(trusted_authenticator)
         with pytest.raises(prawcore.InvalidInvocation):
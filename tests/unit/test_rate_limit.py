@@ -1,7 +1,6 @@
 """Test for prawcore.Sessions module."""
 
-from copy import copy
-from unittest.mock import patch
+import time
 
 import pytest
 
@@ -17,6 +16,12 @@ class TestRateLimiter(UnitTest):
         rate_limiter.next_request_timestamp = 100
         return rate_limiter
 
+    @pytest.fixture
+    def sleep_calls(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(time, "sleep", calls.append)
+        return calls
+
     @staticmethod
     def _headers(remaining, used, reset):
         return {
@@ -25,81 +30,73 @@ class TestRateLimiter(UnitTest):
             "x-ratelimit-reset": str(reset),
         }
 
-    @patch("time.time")
-    @patch("time.sleep")
-    def test_delay(self, mock_sleep, mock_time, rate_limiter):
-        mock_time.return_value = 1
+    def test_delay(self, monkeypatch, rate_limiter, sleep_calls):
+        monkeypatch.setattr(time, "monotonic", lambda: 1)
         rate_limiter.delay()
-        assert mock_time.called
-        mock_sleep.assert_called_with(99)
+        assert sleep_calls == [99]
 
-    @patch("time.time")
-    @patch("time.sleep")
     def test_delay__no_sleep_when_time_in_past(
-        self, mock_sleep, mock_time, rate_limiter
+        self, monkeypatch, rate_limiter, sleep_calls
     ):
-        mock_time.return_value = 101
+        monkeypatch.setattr(time, "monotonic", lambda: 101)
         rate_limiter.delay()
-        assert mock_time.called
-        assert not mock_sleep.called
+        assert not sleep_calls
 
-    @patch("time.sleep")
-    def test_delay__no_sleep_when_time_is_not_set(self, mock_sleep, rate_limiter):
+    def test_delay__no_sleep_when_time_is_not_set(self, rate_limiter, sleep_calls):
+        rate_limiter.next_request_timestamp = None
         rate_limiter.delay()
-        assert not mock_sleep.called
+        assert not sleep_calls
 
-    @patch("time.time")
-    @patch("time.sleep")
     def test_delay__no_sleep_when_times_match(
-        self, mock_sleep, mock_time, rate_limiter
+        self, monkeypatch, rate_limiter, sleep_calls
     ):
-        mock_time.return_value = 100
+        monkeypatch.setattr(time, "monotonic", lambda: 100)
         rate_limiter.delay()
-        assert mock_time.called
-        assert not mock_sleep.called
+        assert not sleep_calls
 
-    @patch("time.time")
-    def test_update__compute_delay_with_no_previous_info(self, mock_time, rate_limiter):
-        mock_time.return_value = 100
+    def test_update__compute_delay_with_no_previous_info(
+        self, monkeypatch, rate_limiter
+    ):
+        monkeypatch.setattr(time, "monotonic", lambda: 100)
+        monkeypatch.setattr(time, "time", lambda: 1000)
         rate_limiter.update(self._headers(60, 100, 60))
         assert rate_limiter.remaining == 60
         assert rate_limiter.used == 100
         assert rate_limiter.next_request_timestamp == 100
+        assert rate_limiter.reset_timestamp == 1060
 
-    @patch("time.time")
-    def test_update__compute_delay_with_single_client(self, mock_time, rate_limiter):
+    def test_update__compute_delay_with_single_client(self, monkeypatch, rate_limiter):
         rate_limiter.remaining = 61
         rate_limiter.window_size = 150
-        mock_time.return_value = 100
+        monkeypatch.setattr(time, "monotonic", lambda: 100)
         rate_limiter.update(self._headers(50, 100, 60))
         assert rate_limiter.remaining == 50
         assert rate_limiter.used == 100
         assert rate_limiter.next_request_timestamp == 110
 
-    @patch("time.time")
-    def test_update__compute_delay_with_six_clients(self, mock_time, rate_limiter):
+    def test_update__compute_delay_with_six_clients(self, monkeypatch, rate_limiter):
         rate_limiter.remaining = 66
         rate_limiter.window_size = 180
-        mock_time.return_value = 100
+        monkeypatch.setattr(time, "monotonic", lambda: 100)
         rate_limiter.update(self._headers(60, 100, 72))
         assert rate_limiter.remaining == 60
         assert rate_limiter.used == 100
         assert rate_limiter.next_request_timestamp == 104.5
 
-    @patch("time.time")
     def test_update__delay_full_time_with_negative_remaining(
-        self, mock_time, rate_limiter
+        self, monkeypatch, rate_limiter
     ):
-        mock_time.return_value = 37
+        monkeypatch.setattr(time, "monotonic", lambda: 37)
         rate_limiter.remaining = -1
         rate_limiter.update(self._headers(0, 100, 13))
         assert rate_limiter.remaining == 0
         assert rate_limiter.used == 100
         assert rate_limiter.next_request_timestamp == 50
 
-    @patch("time.time")
-    def test_update__delay_full_time_with_zero_remaining(self, mock_time, rate_limiter):
-        mock_time.return_value = 37
+    def test_update__delay_full_time_with_zero_remaining(
+        self, monkeypatch, rate_limiter
+    ):
+        monkeypatch.setattr(time, "monotonic", lambda: 37)
         rate_limiter.remaining = 0
         rate_limiter.update(self._headers(0, 100, 13))
         assert rate_limiter.remaining == 0
@@ -107,11 +104,10 @@ class TestRateLimiter(UnitTest):
         assert rate_limiter.next_request_timestamp == 50
 
     def test_update__no_change_without_headers(self, rate_limiter):
-        prev = copy(rate_limiter)
         rate_limiter.update({})
-        assert prev.remaining == rate_limiter.remaining
-        assert prev.used == rate_limiter.used
-        assert rate_limiter.next_request_timestamp == prev.next_request_timestamp
+        assert rate_limiter.remaining is None
+        assert rate_limiter.used is None
+        assert rate_limiter.next_request_timestamp == 100
 
     def test_update__values_change_without_headers(self, rate_limiter):
         rate_limiter.remaining = 10
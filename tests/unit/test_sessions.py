@@ -1,6 +1,7 @@
 """Test for prawcore.Sessions module."""
 
 import logging
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,29 +14,42 @@ from . import UnitTest
 
 
 class InvalidAuthorizer(prawcore.Authorizer):
-    def __init__(self, requestor):
-        super(InvalidAuthorizer, self).__init__(
-            prawcore.TrustedAuthenticator(
-                requestor,
-                pytest.placeholders.client_id,
-                pytest.placeholders.client_secret,
-            )
-        )
-
     def is_valid(self):
         return False
 
 
+@pytest.fixture(scope="module")
+def invalid_authorizer(requestor):
+    return InvalidAuthorizer(
+        prawcore.TrustedAuthenticator(
+            requestor,
+            pytest.placeholders.client_id,
+            pytest.placeholders.client_secret,
+        )
+    )
+
+
 class TestSession(UnitTest):
     @pytest.fixture
     def readonly_authorizer(self, trusted_authenticator):
         return prawcore.ReadOnlyAuthorizer(trusted_authenticator)
 
-    def test_close(self, readonly_authorizer):
-        prawcore.Session(readonly_authorizer).close()
+    @pytest.fixture
+    def unshared_authorizer(self):
+        # Closing the session closes its requestor, so don't use the shared one
+        requestor = prawcore.Requestor("prawcore:test (by /u/bboe)")
+        authenticator = prawcore.TrustedAuthenticator(
+            requestor,
+            pytest.placeholders.client_id,
+            pytest.placeholders.client_secret,
+        )
+        return prawcore.ReadOnlyAuthorizer(authenticator)
+
+    def test_close(self, unshared_authorizer):
+        prawcore.Session(unshared_authorizer).close()
 
-    def test_context_manager(self, readonly_authorizer):
-        with prawcore.Session(readonly_authorizer) as session:
+    def test_context_manager(self, unshared_authorizer):
+        with prawcore.Session(unshared_authorizer) as session:
             assert isinstance(session, prawcore.Session)
 
     def test_init__with_device_id_authorizer(self, untrusted_authenticator):
@@ -50,6 +64,13 @@ class TestSession(UnitTest):
         with pytest.raises(prawcore.InvalidInvocation):
             prawcore.Session(None)
 
+    @patch("prawcore.sessions.pformat")
+    def test_log_request__without_debug_logging(self, mock_pformat, caplog):
+        caplog.set_level(logging.INFO, logger="prawcore")
+        prawcore.Session._log_request([("a", "b")], "GET", {"c": 1}, "/")
+        assert not mock_pformat.called
+        assert not caplog.records
+
     @patch("requests.Session")
     @pytest.mark.parametrize(
         "exception",
@@ -88,14 +109,37 @@ class TestSession(UnitTest):
         assert exception is exception_info.value.original_exception
         assert session_instance.request.call_count == 3
 
-    def test_request__with_invalid_authorizer(self, requestor):
-        session = prawcore.Session(InvalidAuthorizer(requestor))
+    def test_request__with_invalid_authorizer(self, invalid_authorizer):
+        session = prawcore.Session(invalid_authorizer)
         with pytest.raises(prawcore.InvalidInvocation):
             session.request("get", "/")
 
+    def test_set_header_callback__coalesces_concurrent_refreshes(
+        self, readonly_authorizer
+    ):
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+
+        def refresh():
+            refresh_started.set()
+            release_refresh.wait()
+            readonly_authorizer.access_token = "token"
+            readonly_authorizer._expiration_timestamp = float("inf")
+
+        readonly_authorizer.refresh = Mock(side_effect=refresh)
+        session = prawcore.Session(readonly_authorizer)
+        threads = [
+            threading.Thread(target=session._set_header_callback) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        refresh_started.wait()
+        release_refresh.set()
+        for thread in threads:
+            thread.join()
+        assert readonly_authorizer.refresh.call_count == 1
+
 
 class TestSessionFunction(UnitTest):
-    def test_session(self, requestor):
-        assert isinstance(
-            prawcore.session(InvalidAuthorizer(requestor)), prawcore.Session
-        )
+    def test_session(self, invalid_authorizer):
+        assert isinstance(prawcore.session(invalid_authorizer), prawcore.Session)
@@ -3,6 +3,7 @@
 import json
 
 import betamax
+import orjson
 import pytest
 from betamax.serializers import JSONSerializer
 
@@ -42,5 +43,11 @@ def filter_access_token(interaction, current_cassette):
 class PrettyJSONSerializer(JSONSerializer):
     name = "prettyjson"
 
+    def deserialize(self, cassette_data):
+        try:
+            return orjson.loads(cassette_data)
+        except orjson.JSONDecodeError:
+            return {}
+
     def serialize(self, cassette_data):
         return f"{json.dumps(cassette_data, sort_keys=True, indent=2)}\n"